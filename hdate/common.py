@@ -1,7 +1,6 @@
 """Small helper classes."""
 
 import datetime
-import sys
 
 import pytz
 
@@ -13,11 +12,6 @@ class BaseClass(object):  # pylint: disable=useless-object-inheritance
 
     def __str__(self):
         """Return a string representation."""
-        if sys.version_info.major < 3:
-            # pylint: disable=undefined-variable
-            # pylint-comment: When using python3 and up, unicode() is undefined
-            return unicode(self).encode("utf-8")  # noqa: F821
-
         return self.__unicode__()
 
     def __unicode__(self):  # pragma: no cover
@@ -59,6 +53,7 @@ class Location(BaseClass):
     ):
         """Initialitze the location object."""
         self._timezone = None
+        self._timezone_name = None
         self.name = name
         self.latitude = latitude
         self.longitude = longitude
@@ -66,6 +61,25 @@ class Location(BaseClass):
         self.altitude = altitude
         self.diaspora = diaspora
 
+    def __hash__(self):
+        """Return a hash based on the attributes defining the location.
+
+        Locations are mutable, so the hash is computed on demand rather
+        than stored. This allows using a Location as a cache key. The key
+        is built from plain attributes only; the timezone name is
+        precomputed by the timezone setter.
+        """
+        return hash(
+            (
+                self.name,
+                self.latitude,
+                self.longitude,
+                self._timezone_name,
+                self.altitude,
+                self.diaspora,
+            )
+        )
+
     def __repr__(self):
         """Return a representation of Location for programmatic use."""
         return (
@@ -91,3 +105,4 @@ class Location(BaseClass):
         self._timezone = (
             value if isinstance(value, datetime.tzinfo) else pytz.timezone(value)
         )
+        self._timezone_name = str(self._timezone)
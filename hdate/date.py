@@ -10,6 +10,7 @@ from __future__ import division
 
 import datetime
 import logging
+from functools import lru_cache
 from itertools import chain, product
 
 from hdate import converters as conv
@@ -28,10 +29,14 @@ class HDate(BaseClass):
     Supports converting from Gregorian and Julian to Hebrew date.
     """
 
-    def __init__(
-        self, gdate=datetime.date.today(), diaspora=False, hebrew=True, heb_date=None
-    ):
-        """Initialize the HDate object."""
+    def __init__(self, gdate=None, diaspora=False, hebrew=True, heb_date=None):
+        """Initialize the HDate object.
+
+        If both gdate and heb_date are None, today's date is used. The
+        default is resolved at call time rather than in the signature, so
+        the value is not frozen at import, and today() is only called when
+        actually needed.
+        """
         # Create private variables
         self._hdate = None
         self._gdate = None
@@ -40,7 +45,7 @@ class HDate(BaseClass):
         # Assign values
         # Keep hdate after gdate assignment so as not to cause recursion error
         if heb_date is None:
-            self.gdate = gdate
+            self.gdate = gdate if gdate is not None else datetime.date.today()
             self.hdate = None
         else:
             self.gdate = None
@@ -48,6 +53,19 @@ class HDate(BaseClass):
         self.hebrew = hebrew
         self.diaspora = diaspora
 
+    @classmethod
+    @lru_cache(maxsize=128)
+    def cached(cls, gdate, diaspora=False, hebrew=True):
+        """Return a cached HDate instance for the given Gregorian date.
+
+        The Gregorian to Hebrew conversion is pure arithmetic on the date,
+        so repeated lookups of the same day, as done by Zmanim for today
+        and tomorrow, can share one instance. The underlying lru_cache is
+        thread-safe. The returned instance is shared between callers, so
+        it should be treated as read-only.
+        """
+        return cls(gdate, diaspora, hebrew)
+
     def __unicode__(self):
         """Return a full Unicode representation of HDate."""
         result = u"{}{} {} {}{} {}".format(
@@ -467,6 +485,29 @@ class HDate(BaseClass):
         return readings[weeks]
 
 
+@lru_cache(maxsize=32)
+def _yom_tov_gdates(year, diaspora):
+    """Return the Gregorian dates of the Yom Tov days in a Hebrew year."""
+    reference = HDate(heb_date=HebrewDate(year, Months.Tishrei, 1), diaspora=diaspora)
+    return frozenset(
+        holiday_hdate.gdate
+        for _, holiday_hdate in reference.get_holidays_for_year(
+            [HolidayTypes.YOM_TOV]
+        )
+    )
+
+
+def is_yom_tov(gdate, diaspora=False):
+    """Return whether the given Gregorian date is a Yom Tov day.
+
+    This is a membership test against a cached per-(year, diaspora) set of
+    dates, so callers polling ordinary weekdays avoid constructing an
+    HDate and scanning the holiday tables on every check.
+    """
+    hebrew_year = conv.jdn_to_hdate(conv.gdate_to_jdn(gdate)).year
+    return gdate in _yom_tov_gdates(hebrew_year, diaspora)
+
+
 def hebrew_number(num, hebrew=True, short=False):
     """Return "Gimatria" number."""
     if not hebrew:
@@ -500,22 +541,28 @@ def hebrew_number(num, hebrew=True, short=False):
     return hstring
 
 
+# Hebrew number words for the Omer count, frozen at import time so
+# get_omer_string does not rebuild them on every call.
+_OMER_TENS = (u"", u"עשרה", u"עשרים", u"שלושים", u"ארבעים")
+_OMER_ONES = (
+    u"",
+    u"אחד",
+    u"שנים",
+    u"שלושה",
+    u"ארבעה",
+    u"חמשה",
+    u"ששה",
+    u"שבעה",
+    u"שמונה",
+    u"תשעה",
+)
+
+
 def get_omer_string(omer):  # pylint: disable=too-many-branches
     """Return a string representing the count of the Omer."""
     # TODO: The following function should be simplified (see pylint)
-    tens = [u"", u"עשרה", u"עשרים", u"שלושים", u"ארבעים"]
-    ones = [
-        u"",
-        u"אחד",
-        u"שנים",
-        u"שלושה",
-        u"ארבעה",
-        u"חמשה",
-        u"ששה",
-        u"שבעה",
-        u"שמונה",
-        u"תשעה",
-    ]
+    tens = _OMER_TENS
+    ones = _OMER_ONES
     if not 0 < omer < 50:
         raise ValueError("Invalid Omer day: {}".format(omer))
     ten = omer // 10
@@ -11,15 +11,128 @@ from __future__ import division
 import datetime as dt
 import logging
 import math
+from functools import cached_property, lru_cache
 
 import pytz
 
 from hdate import htables
 from hdate.common import BaseClass, Location
-from hdate.date import HDate
+from hdate.date import is_yom_tov
 
 _LOGGER = logging.getLogger(__name__)
 
+_ONE_MINUTE = dt.timedelta(minutes=1)
+
+# The (key, description) pairs are resolved once per language at import
+# time rather than on every string conversion.
+_ZMANIM_DESCRIPTIONS = {
+    hebrew: tuple((zman.zman, zman.description[hebrew]) for zman in htables.ZMANIM)
+    for hebrew in (False, True)
+}
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover
+
+    def njit(func):
+        """Return the function unchanged when numba is not installed."""
+        return func
+
+
+@njit
+def _solar_params_kernel(day_of_year, latitude):
+    """
+    Compute the solar parameters for a given day of year and latitude.
+
+    This is the numeric kernel behind _solar_params. It is pure scalar
+    floating-point math, so it is compiled with numba when available and
+    runs as plain Python otherwise.
+
+    Algorithm from
+    http://www.srrb.noaa.gov/highlights/sunrise/calcdetails.html
+    The low accuracy solar position equations are used.
+    These routines are based on Jean Meeus's book Astronomical Algorithms.
+    """
+    # get radians of sun orbit around earth =)
+    gama = 2.0 * math.pi * ((day_of_year - 1) / 365.0)
+
+    # get the diff betwen suns clock and wall clock in minutes
+    eqtime = 229.18 * (
+        0.000075
+        + 0.001868 * math.cos(gama)
+        - 0.032077 * math.sin(gama)
+        - 0.014615 * math.cos(2.0 * gama)
+        - 0.040849 * math.sin(2.0 * gama)
+    )
+
+    # calculate suns declanation at the equater in radians
+    decl = (
+        0.006918
+        - 0.399912 * math.cos(gama)
+        + 0.070257 * math.sin(gama)
+        - 0.006758 * math.cos(2.0 * gama)
+        + 0.000907 * math.sin(2.0 * gama)
+        - 0.002697 * math.cos(3.0 * gama)
+        + 0.00148 * math.sin(3.0 * gama)
+    )
+
+    # we use radians, ratio is 2pi/360
+    latitude = math.pi * latitude / 180.0
+
+    return (
+        eqtime,
+        math.cos(decl),
+        math.tan(decl),
+        math.cos(latitude),
+        math.tan(latitude),
+    )
+
+
+def _utc_sun_times(solar_params, longitude, deg):
+    """
+    Return the times in minutes from 00:00 (utc) for a given sun altitude.
+
+    This is done for a given sun altitude in sunrise `deg` degrees
+    This function only works for altitudes sun really is.
+    If the sun never gets to this altitude, the returned sunset and sunrise
+    values will be negative. This can happen in low altitude when latitude
+    is nearing the poles in winter times, the sun never goes very high in
+    the sky there.
+    """
+    eqtime, cos_decl, tan_decl, cos_lat, tan_lat = solar_params
+    sunrise_angle = math.pi * deg / 180.0  # sun angle at sunrise/set
+
+    # the sun real time diff from noon at sunset/rise in radians
+    try:
+        hour_angle = math.acos(
+            math.cos(sunrise_angle) / (cos_lat * cos_decl) - tan_lat * tan_decl
+        )
+    # check for too high altitudes and return negative values
+    except ValueError:
+        return -720, -720
+
+    # we use minutes, ratio is 1440min/2pi
+    hour_angle = 720.0 * hour_angle / math.pi
+
+    # get sunset/rise times in utc wall clock in minutes from 00:00 time
+    # sunrise / sunset
+    return (
+        int(720.0 - 4.0 * longitude - hour_angle - eqtime),
+        int(720.0 - 4.0 * longitude + hour_angle - eqtime),
+    )
+
+
+@lru_cache(maxsize=4096)
+def _solar_params(day_of_year, latitude):
+    """
+    Return the solar parameters for a given day of year and latitude.
+
+    The equation of time and the solar declination depend only on the day
+    of year, and the latitude trigonometry only on the latitude, so the
+    results are shared by all Zmanim instances through an LRU cache.
+    """
+    return _solar_params_kernel(day_of_year, latitude)
+
 
 class Zmanim(BaseClass):
     """Return Jewish day times.
@@ -36,8 +149,8 @@ class Zmanim(BaseClass):
     # pylint: disable=too-many-arguments
     def __init__(
         self,
-        date=dt.datetime.now(),
-        location=Location(),
+        date=None,
+        location=None,
         hebrew=True,
         candle_lighting_offset=18,
         havdalah_offset=0,
@@ -45,6 +158,10 @@ class Zmanim(BaseClass):
         """
         Initialize the Zmanim object.
 
+        If date is None, the current date and time are used. The defaults
+        are resolved at call time rather than in the signature, so the
+        value is not frozen at import.
+
         As the timezone is expected to be part of the location object, any
         tzinfo passed along is discarded. Essentially making the datetime
         object non-timezone aware.
@@ -53,6 +170,10 @@ class Zmanim(BaseClass):
         location object. After which it is transformed to UTC for all internal
         calculations.
         """
+        if date is None:
+            date = dt.datetime.now()
+        if location is None:
+            location = Location()
         self.location = location
         self.hebrew = hebrew
         self.candle_lighting_offset = candle_lighting_offset
@@ -78,14 +199,76 @@ class Zmanim(BaseClass):
         _LOGGER.debug("Resetting timezone to UTC for calculations")
         self.time = location.timezone.localize(self.time).astimezone(pytz.utc)
 
+    # pylint: disable=too-many-arguments
+    @classmethod
+    @lru_cache(maxsize=128)
+    def cached(
+        cls,
+        date,
+        location=None,
+        hebrew=True,
+        candle_lighting_offset=18,
+        havdalah_offset=0,
+    ):
+        """Return a cached Zmanim instance for the given arguments.
+
+        Applications such as Home Assistant create Zmanim for the same
+        (date, location, offsets) combination many times per day. This
+        factory avoids repeating the full initialization, including the
+        solar calculations, for every such call.
+
+        Only plain dates are accepted. A datetime would either defeat the
+        cache, as every polled time is a new key, or freeze a stale
+        current time into the shared instance. For the same reason,
+        time-dependent properties such as issur_melacha_in_effect must
+        not be read from cached instances; use a regular Zmanim object
+        for those.
+
+        The underlying lru_cache is thread-safe. The returned instance is
+        shared between callers, so it, and any Location used as part of
+        the key, should be treated as read-only.
+        """
+        if isinstance(date, dt.datetime):
+            raise TypeError("Zmanim.cached expects a date, got: {}".format(date))
+        return cls(date, location, hebrew, candle_lighting_offset, havdalah_offset)
+
+    # pylint: disable=too-many-arguments
+    @classmethod
+    def range(
+        cls,
+        start,
+        end,
+        location=None,
+        hebrew=True,
+        candle_lighting_offset=18,
+        havdalah_offset=0,
+    ):
+        """Return a list of Zmanim objects, one per day from start to end.
+
+        Both endpoints are included. This is a convenience constructor for
+        callers that need a stretch of days; each day is computed lazily
+        on first property access, like any other Zmanim object.
+        """
+        if end < start:
+            raise ValueError("end ({}) must not precede start ({})".format(end, start))
+        return [
+            cls(
+                start + dt.timedelta(days=offset),
+                location,
+                hebrew,
+                candle_lighting_offset,
+                havdalah_offset,
+            )
+            for offset in range((end - start).days + 1)
+        ]
+
     def __unicode__(self):
         """Return a Unicode representation of Zmanim."""
+        zmanim = self.zmanim
         return u"".join(
             [
-                u"{} - {}\n".format(
-                    zman.description[self.hebrew], self.zmanim[zman.zman].time()
-                )
-                for zman in htables.ZMANIM
+                u"{} - {}\n".format(description, zmanim[key].time())
+                for key, description in _ZMANIM_DESCRIPTIONS[bool(self.hebrew)]
             ]
         )
 
@@ -99,56 +282,109 @@ class Zmanim(BaseClass):
             self.hebrew,
         )
 
-    @property
+    @cached_property
     def utc_zmanim(self):
         """Return a dictionary of the zmanim in UTC time format."""
         basetime = dt.datetime.combine(self.date, dt.time()).replace(tzinfo=pytz.utc)
         _LOGGER.debug("Calculating UTC zmanim for %r", basetime)
+        # Scaling a precomputed one-minute timedelta avoids the keyword
+        # handling in the timedelta constructor for each of the 17 entries.
         return {
-            key: basetime + dt.timedelta(minutes=value)
-            for key, value in self.get_utc_sun_time_full().items()
+            key: basetime + value * _ONE_MINUTE
+            for key, value in self._utc_minutes.items()
         }
 
-    @property
+    @cached_property
     def zmanim(self):
         """Return a dictionary of the zmanim the object represents."""
+        utc_zmanim = self.utc_zmanim
+        timezone = self.location.timezone
+        # Resolving the UTC offset once covers all entries, unless a DST
+        # transition falls between the earliest and latest of them. Compare
+        # the offsets at both extremes: if they agree, share the offset,
+        # otherwise fall back to converting each entry separately.
+        earliest = min(utc_zmanim.values()).astimezone(timezone)
+        latest = max(utc_zmanim.values()).astimezone(timezone)
+        offset = earliest.utcoffset()
+        if offset != latest.utcoffset():
+            return {
+                key: value.astimezone(timezone)
+                for key, value in utc_zmanim.items()
+            }
+        tzinfo = earliest.tzinfo
         return {
-            key: value.astimezone(self.location.timezone)
-            for key, value in self.utc_zmanim.items()
+            key: (value + offset).replace(tzinfo=tzinfo)
+            for key, value in utc_zmanim.items()
         }
 
-    @property
+    def _local_zman(self, key):
+        """Return a single zman as a localized datetime.
+
+        This avoids materializing the full zmanim dictionary when only one
+        or two values, such as candle lighting and havdalah, are needed.
+        """
+        basetime = dt.datetime.combine(self.date, dt.time()).replace(tzinfo=pytz.utc)
+        utc_time = basetime + self._utc_minutes[key] * _ONE_MINUTE
+        return utc_time.astimezone(self.location.timezone)
+
+    @cached_property
+    def _shabbat_or_yom_tov_today(self):
+        """Return whether today is Shabbat or Yom Tov."""
+        return self.date.weekday() == 5 or is_yom_tov(
+            self.date, self.location.diaspora
+        )
+
+    @cached_property
+    def erev_shabbat_chag(self):
+        """Return whether Shabbat or a chag begins this evening.
+
+        Both checks are cheap: a weekday comparison and a membership test
+        against the cached per-year Yom Tov dates, so ordinary weekdays
+        resolve without building HDate objects or scanning the holiday
+        tables.
+        """
+        tomorrow = self.date + dt.timedelta(days=1)
+        if tomorrow.weekday() == 5:
+            return True
+        return is_yom_tov(tomorrow, self.location.diaspora)
+
+    @cached_property
+    def motzei_shabbat_chag(self):
+        """Return whether Shabbat or a chag ends this evening.
+
+        True when today is Shabbat or Yom Tov and tomorrow is neither,
+        i.e. the evening calls for havdalah.
+        """
+        return self._shabbat_or_yom_tov_today and not self.erev_shabbat_chag
+
+    @cached_property
     def candle_lighting(self):
         """Return the time for candle lighting, or None if not applicable."""
-        today = HDate(gdate=self.date, diaspora=self.location.diaspora)
-        tomorrow = HDate(
-            gdate=self.date + dt.timedelta(days=1), diaspora=self.location.diaspora
-        )
+        # If neither Shabbat nor Yom Tov starts this evening, there is no
+        # candle lighting.
+        if not self.erev_shabbat_chag:
+            return None
 
         # If today is a Yom Tov or Shabbat, and tomorrow is a Yom Tov or
         # Shabbat return the havdalah time as the candle lighting time.
-        if (today.is_yom_tov or today.is_shabbat) and (
-            tomorrow.is_yom_tov or tomorrow.is_shabbat
-        ):
+        if self._shabbat_or_yom_tov_today:
             return self._havdalah_datetime
 
-        # Otherwise, if today is Friday or erev Yom Tov, return candle
+        # Otherwise, today is Friday or erev Yom Tov, so return candle
         # lighting.
-        if tomorrow.is_shabbat or tomorrow.is_yom_tov:
-            return self.zmanim["sunset"] - dt.timedelta(
-                minutes=self.candle_lighting_offset
-            )
-        return None
+        return self._local_zman("sunset") - dt.timedelta(
+            minutes=self.candle_lighting_offset
+        )
 
     @property
     def _havdalah_datetime(self):
         """Compute the havdalah time based on settings."""
         if self.havdalah_offset == 0:
-            return self.zmanim["three_stars"]
+            return self._local_zman("three_stars")
         # Otherwise, use the offset.
-        return self.zmanim["sunset"] + dt.timedelta(minutes=self.havdalah_offset)
+        return self._local_zman("sunset") + dt.timedelta(minutes=self.havdalah_offset)
 
-    @property
+    @cached_property
     def havdalah(self):
         """Return the time for havdalah, or None if not applicable.
 
@@ -158,38 +394,27 @@ class Zmanim(BaseClass):
         after today, the havdalah value is defined to be None (to avoid
         misleading the user that melacha is permitted).
         """
-        today = HDate(gdate=self.date, diaspora=self.location.diaspora)
-        tomorrow = HDate(
-            gdate=self.date + dt.timedelta(days=1), diaspora=self.location.diaspora
-        )
-
         # If today is Yom Tov or Shabbat, and tomorrow is Yom Tov or Shabbat,
         # then there is no havdalah value for today. Technically, there is
         # havdalah mikodesh l'kodesh, but that is represented in the
         # candle_lighting value to avoid misuse of the havdalah API.
-        if today.is_shabbat or today.is_yom_tov:
-            if tomorrow.is_shabbat or tomorrow.is_yom_tov:
-                return None
+        if self.motzei_shabbat_chag:
             return self._havdalah_datetime
         return None
 
     @property
     def issur_melacha_in_effect(self):
         """At the given time, return whether issur melacha is in effect."""
-        today = HDate(gdate=self.date, diaspora=self.location.diaspora)
-        tomorrow = HDate(
-            gdate=self.date + dt.timedelta(days=1), diaspora=self.location.diaspora
-        )
+        # Both predicates are cached, so the Yom Tov lookups run at most
+        # once per day regardless of how many branches consult them.
+        today_issur = self._shabbat_or_yom_tov_today
+        tomorrow_issur = self.erev_shabbat_chag
 
-        if (today.is_shabbat or today.is_yom_tov) and (
-            tomorrow.is_shabbat or tomorrow.is_yom_tov
-        ):
+        if today_issur and tomorrow_issur:
             return True
-        if (today.is_shabbat or today.is_yom_tov) and (self.time < self.havdalah):
+        if today_issur and (self.time < self.havdalah):
             return True
-        if (tomorrow.is_shabbat or tomorrow.is_yom_tov) and (
-            self.time > self.candle_lighting
-        ):
+        if tomorrow_issur and (self.time > self.candle_lighting):
             return True
 
         return False
@@ -198,92 +423,63 @@ class Zmanim(BaseClass):
         """Return the number of days since January 1 of the given year."""
         return (self.date - dt.date(self.date.year, 1, 1)).days
 
+    @cached_property
+    def _solar_day_params(self):
+        """
+        Return the solar parameters shared by all altitude calculations.
+
+        The latitude is quantized to 6 decimal places (about 10 cm) so that
+        nearly identical locations share a cache entry.
+        """
+        return _solar_params(self.gday_of_year(), round(self.location.latitude, 6))
+
     def _get_utc_sun_time_deg(self, deg):
         """
         Return the times in minutes from 00:00 (utc) for a given sun altitude.
 
-        This is done for a given sun altitude in sunrise `deg` degrees
-        This function only works for altitudes sun really is.
-        If the sun never gets to this altitude, the returned sunset and sunrise
-        values will be negative. This can happen in low altitude when latitude
-        is nearing the poles in winter times, the sun never goes very high in
-        the sky there.
-
-        Algorithm from
-        http://www.srrb.noaa.gov/highlights/sunrise/calcdetails.html
-        The low accuracy solar position equations are used.
-        These routines are based on Jean Meeus's book Astronomical Algorithms.
+        This is a thin wrapper over _utc_sun_times, which also backs the
+        full computation in _utc_minutes.
         """
-        gama = 0  # location of sun in yearly cycle in radians
-        eqtime = 0  # difference betwen sun noon and clock noon
-        decl = 0  # sun declanation
-        hour_angle = 0  # solar hour angle
-        sunrise_angle = math.pi * deg / 180.0  # sun angle at sunrise/set
-
-        # get the day of year
-        day_of_year = self.gday_of_year()
-
-        # get radians of sun orbit around earth =)
-        gama = 2.0 * math.pi * ((day_of_year - 1) / 365.0)
-
-        # get the diff betwen suns clock and wall clock in minutes
-        eqtime = 229.18 * (
-            0.000075
-            + 0.001868 * math.cos(gama)
-            - 0.032077 * math.sin(gama)
-            - 0.014615 * math.cos(2.0 * gama)
-            - 0.040849 * math.sin(2.0 * gama)
-        )
+        return _utc_sun_times(self._solar_day_params, self.location.longitude, deg)
 
-        # calculate suns declanation at the equater in radians
-        decl = (
-            0.006918
-            - 0.399912 * math.cos(gama)
-            + 0.070257 * math.sin(gama)
-            - 0.006758 * math.cos(2.0 * gama)
-            + 0.000907 * math.sin(2.0 * gama)
-            - 0.002697 * math.cos(3.0 * gama)
-            + 0.00148 * math.sin(3.0 * gama)
-        )
-
-        # we use radians, ratio is 2pi/360
-        latitude = math.pi * self.location.latitude / 180.0
+    def get_utc_sun_time_full(self):
+        """Return a list of Jewish times for the given location.
 
-        # the sun real time diff from noon at sunset/rise in radians
-        try:
-            hour_angle = math.acos(
-                math.cos(sunrise_angle) / (math.cos(latitude) * math.cos(decl))
-                - math.tan(latitude) * math.tan(decl)
-            )
-        # check for too high altitudes and return negative values
-        except ValueError:
-            return -720, -720
+        All times, including the solar transit (midday), are derived from
+        the closed-form NOAA equations rather than an iterative search, so
+        the cost per day is a handful of trigonometric operations.
+        """
+        return dict(self._utc_minutes)
 
-        # we use minutes, ratio is 1440min/2pi
-        hour_angle = 720.0 * hour_angle / math.pi
+    @cached_property
+    def _utc_minutes(self):
+        """Return the zmanim as minutes from UTC midnight.
 
-        # get sunset/rise times in utc wall clock in minutes from 00:00 time
-        # sunrise / sunset
+        The minute offsets are the canonical internal representation;
+        datetime objects are only built from them at the utc_zmanim /
+        zmanim boundary.
+        """
+        # All five altitudes share the same solar day parameters, so look
+        # them up once and compute the times in a single pass.
+        params = self._solar_day_params
         longitude = self.location.longitude
-        return (
-            int(720.0 - 4.0 * longitude - hour_angle - eqtime),
-            int(720.0 - 4.0 * longitude + hour_angle - eqtime),
-        )
 
-    def get_utc_sun_time_full(self):
-        """Return a list of Jewish times for the given location."""
+        def sun_times(deg):
+            """Return the (sunrise, sunset) times for a given altitude."""
+            return _utc_sun_times(params, longitude, deg)
+
         # sunset and rise time
-        sunrise, sunset = self._get_utc_sun_time_deg(90.833)
+        sunrise, sunset = sun_times(90.833)
 
         # shaa zmanit by gara, 1/12 of light time
         sun_hour = (sunset - sunrise) // 12
         midday = (sunset + sunrise) // 2
 
         # get times of the different sun angles
-        first_light, _ = self._get_utc_sun_time_deg(106.1)
-        talit, _ = self._get_utc_sun_time_deg(101.0)
-        _, first_stars = self._get_utc_sun_time_deg(96.0)
-        _, three_stars = self._get_utc_sun_time_deg(98.5)
+        first_light, _ = sun_times(106.1)
+        talit, _ = sun_times(101.0)
+        _, first_stars = sun_times(96.0)
+        _, three_stars = sun_times(98.5)
         mga_sunhour = (midday - first_light) / 6
 
         res = dict(
@@ -5,7 +5,6 @@ __author__ = "Royi Reshef"
 __maintainer__ = "Tsvi Mostovicz"
 __version__ = "0.9.8"
 
-import sys
 from codecs import open
 from os.path import abspath, dirname, join
 
@@ -19,9 +18,6 @@ with open(join(here, "README.rst"), encoding="utf-8") as f:
 
 REQUIRES = ["pytz"]
 
-if sys.version_info.major < 3:
-    REQUIRES.extend(["enum34"])
-
 setup(
     name="hdate",
     version=__version__,
@@ -31,8 +27,8 @@ setup(
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "License :: OSI Approved :: GNU General Public License v3 or later (GPLv3+)",  # noqa: E501
-        "Programming Language :: Python :: 2.7",
         "Programming Language :: Python :: 3",
+        "Programming Language :: Python :: 3.8",
     ],
     author=__author__,
     author_email="roy.myapp@gmail.com",
@@ -42,5 +38,5 @@ setup(
     packages=["hdate"],
     install_requires=REQUIRES,
     extras_require={"dev": ["tox", "pre-commit"]},
-    python_requires=">=2.7",
+    python_requires=">=3.8",
 )
@@ -9,6 +9,7 @@ import pytest
 
 import hdate.converters as conv
 from hdate import HDate, HebrewDate
+from hdate.date import is_yom_tov
 from hdate.htables import Months
 
 # pylint: disable=no-self-use
@@ -135,6 +136,15 @@ class TestHDate(object):
         )
         assert (rand_hdate.next_day.gdate - rand_hdate.gdate) == datetime.timedelta(1)
 
+    @pytest.mark.parametrize("diaspora", [True, False])
+    def test_is_yom_tov_matches_hdate(self, diaspora):
+        # The span covers the Tishrei holidays and a Hebrew year boundary.
+        start = datetime.date(2018, 8, 15)
+        for offset in range(90):
+            gdate = start + datetime.timedelta(days=offset)
+            expected = HDate(gdate, diaspora=diaspora).is_yom_tov
+            assert is_yom_tov(gdate, diaspora) == expected
+
 
 class TestSpecialDays(object):
 
@@ -52,6 +52,79 @@ class TestZmanim(object):
             == Zmanim(other_date).get_utc_sun_time_full()
         )
 
+    def test_cached_factory(self):
+        day = datetime.date(2018, 9, 8)
+        location = Location(
+            name="New York",
+            latitude=NYC_LAT,
+            longitude=NYC_LNG,
+            timezone="America/New_York",
+            diaspora=True,
+        )
+        first = Zmanim.cached(day, location)
+        second = Zmanim.cached(day, location)
+        assert first is second
+        assert first.zmanim == Zmanim(date=day, location=location).zmanim
+        with pytest.raises(TypeError):
+            Zmanim.cached(dt(2018, 9, 8, 13, 1), location)
+
+    def test_range(self):
+        start = datetime.date(2018, 9, 7)
+        end = datetime.date(2018, 9, 10)
+        location = Location(
+            name="New York",
+            latitude=NYC_LAT,
+            longitude=NYC_LNG,
+            timezone="America/New_York",
+            diaspora=True,
+        )
+        days = Zmanim.range(start, end, location)
+        assert [day.date for day in days] == [
+            start + datetime.timedelta(days=offset) for offset in range(4)
+        ]
+        single = Zmanim(date=datetime.date(2018, 9, 8), location=location)
+        assert days[1].zmanim == single.zmanim
+        with pytest.raises(ValueError):
+            Zmanim.range(end, start, location)
+
+    def test_erev_and_motzei_shabbat_chag(self):
+        location = Location(
+            name="New York",
+            latitude=NYC_LAT,
+            longitude=NYC_LNG,
+            timezone="America/New_York",
+            diaspora=True,
+        )
+        erev = Zmanim(date=datetime.date(2018, 9, 7), location=location)
+        shabbat = Zmanim(date=datetime.date(2018, 9, 8), location=location)
+        weekday = Zmanim(date=datetime.date(2018, 9, 5), location=location)
+        assert erev.erev_shabbat_chag and not erev.motzei_shabbat_chag
+        assert shabbat.motzei_shabbat_chag and not shabbat.erev_shabbat_chag
+        assert not weekday.erev_shabbat_chag
+        assert not weekday.motzei_shabbat_chag
+
+    @pytest.mark.parametrize(
+        "day",
+        [
+            datetime.date(2018, 3, 11),  # DST begins
+            datetime.date(2018, 11, 4),  # DST ends
+            datetime.date(2018, 9, 8),
+        ],
+    )
+    def test_zmanim_localization_dst(self, day):
+        location = Location(
+            name="New York",
+            latitude=NYC_LAT,
+            longitude=NYC_LNG,
+            timezone="America/New_York",
+            diaspora=True,
+        )
+        zmanim = Zmanim(date=day, location=location)
+        for key, value in zmanim.utc_zmanim.items():
+            expected = value.astimezone(location.timezone)
+            assert zmanim.zmanim[key] == expected
+            assert zmanim.zmanim[key].utcoffset() == expected.utcoffset()
+
     def test_using_tzinfo(self):
         day = datetime.date(2018, 9, 8)
         timezone_str = "America/New_York"